@@ -100,6 +100,12 @@ UI_CONFIG = {
     'warning_threshold_dscr': 1.25,
 }
 
+# ===== PERFORMANCE =====
+# Run the broadcasted sensitivity/scenario sweeps in float32 (KPI reductions stay float64).
+# Off by default: the app's 3-5 row sweeps gain nothing, and float32 KPIs can differ
+# from the single-project metrics at the 2 decimals shown
+USE_FP32_SWEEP = False
+
 # ===== LOGGING & DEBUG =====
 DEBUG_MODE = False
 LOG_LEVEL = 'INFO'
@@ -1,19 +1,123 @@
 # financial_engine.py - Core Financial Calculation Engine
 # Handles all financial modeling and calculations for PPP projects
 
+import functools
 import numpy as np
 import pandas as pd
-import numpy_financial as npf
+from numba import njit, guvectorize, float32, float64
 from typing import Dict, List, Tuple, Any
 import logging
 from dataclasses import dataclass
 from config import (
     DefaultFinancialParams, SCENARIO_ADJUSTMENTS, 
-    STRESS_TESTS, FINANCIAL_BENCHMARKS
+    STRESS_TESTS, FINANCIAL_BENCHMARKS, USE_FP32_SWEEP
 )
 
 logger = logging.getLogger(__name__)
 
+@njit(cache=True, fastmath=True)
+def _carryforward_into(ebt: np.ndarray, tax_rate: float, taxable_income: np.ndarray, tax: np.ndarray) -> None:
+    """Loss carryforward recurrence over an EBT array, written into the outputs"""
+    cumulative_loss = 0.0
+    for i in range(ebt.shape[0]):
+        loss_to_use = min(cumulative_loss, max(0.0, -ebt[i]))
+        taxable = max(0.0, ebt[i] + loss_to_use)
+        taxable_income[i] = taxable
+        tax[i] = max(0.0, taxable * tax_rate)
+        
+        if ebt[i] < 0:
+            cumulative_loss += abs(ebt[i])
+        else:
+            cumulative_loss -= loss_to_use
+
+@njit(cache=True, fastmath=True)
+def _tax_loop_numba(ebt: np.ndarray, tax_rate: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Loss carryforward recurrence over an EBT array (JIT-compiled)"""
+    n = ebt.shape[0]
+    taxable_income = np.zeros(n)
+    tax = np.zeros(n)
+    _carryforward_into(ebt, tax_rate, taxable_income, tax)
+    return taxable_income, tax
+
+@guvectorize(
+    [(float32[:], float32, float32[:], float32[:]), (float64[:], float64, float64[:], float64[:])],
+    '(n),()->(n),(n)', target='cpu', cache=True
+)
+def _tax_gufunc(ebt, tax_rate, taxable_income, tax):
+    """Row-wise loss carryforward over an (S, T) EBT matrix"""
+    _carryforward_into(ebt, tax_rate, taxable_income, tax)
+
+@njit(cache=True, fastmath=True)
+def _operating_kernel(growth_factor: np.ndarray, inflation_factor: np.ndarray,
+                      initial_revenue: float, op_cost_ratio: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Revenue, operating cost and EBITDA in one fused pass over the years"""
+    n = growth_factor.shape[0]
+    revenue = np.empty(n)
+    opcost = np.empty(n)
+    ebitda = np.empty(n)
+    for t in range(n):
+        rev = initial_revenue * growth_factor[t]
+        op = rev * op_cost_ratio * inflation_factor[t]
+        revenue[t] = rev
+        opcost[t] = op
+        ebitda[t] = rev - op
+    return revenue, opcost, ebitda
+
+@njit(cache=True)
+def _fast_irr(cf: np.ndarray, guess: float = 0.1, tol: float = 1e-7, maxit: int = 100) -> float:
+    """IRR by damped Newton-Raphson on the NPV polynomial; NaN if it does not converge"""
+    # Iterate on the discount factor d = 1 / (1 + r): for -CAPEX then positive
+    # CFADS, NPV(d) is increasing and convex with a single positive root. Each
+    # step is clamped to [d/2, 2d] so a long first jump (low or negative IRR)
+    # cannot land far past the root, and d stays positive
+    d = 1.0 / (1.0 + guess)
+    rate = guess
+    for _ in range(maxit):
+        npv = 0.0
+        dnpv = 0.0
+        for t in range(cf.shape[0] - 1, -1, -1):
+            dnpv = dnpv * d + npv
+            npv = npv * d + cf[t]
+        if dnpv == 0.0 or not np.isfinite(npv):
+            return np.nan
+        
+        d = min(max(d - npv / dnpv, 0.5 * d), 2.0 * d)
+        new_rate = 1.0 / d - 1.0
+        if abs(new_rate - rate) < tol:
+            return new_rate
+        rate = new_rate
+    
+    return np.nan
+
+def _irr(cf: np.ndarray) -> float:
+    """Project IRR; with several real roots, the one closest to zero (as numpy_financial.irr)"""
+    signs = np.sign(cf[cf != 0])
+    if np.count_nonzero(signs[1:] != signs[:-1]) <= 1:
+        # At most one sign change: the root is unique, so Newton finds it
+        return _fast_irr(cf)
+    
+    # Several sign changes (e.g. late-year CFADS turning negative): take every real
+    # positive discount-factor root of the polynomial and keep the rate nearest zero
+    roots = np.roots(cf[::-1])
+    d = roots[(roots.imag == 0) & (roots.real > 0)].real
+    if len(d) == 0:
+        return np.nan
+    rates = 1.0 / d - 1.0
+    return float(rates[np.argmin(np.abs(rates))])
+
+# Warm the JIT cache at import so compilation doesn't land on the first request
+_tax_loop_numba(np.zeros(1), 0.0)
+_readonly_ones = np.ones(1)
+_readonly_ones.setflags(write=False)  # matches the cached, read-only factor vectors
+_operating_kernel(_readonly_ones, _readonly_ones, 1.0, 0.0)
+_fast_irr(np.array([-1.0, 1.1]))
+
+# Parameters that may vary across rows of a broadcasted batch (project_period may not)
+_BATCH_PARAMS = (
+    'total_investment', 'depreciation_period', 'equity_ratio', 'debt_rate', 'tax_rate',
+    'initial_revenue', 'revenue_growth', 'op_cost_ratio', 'inflation',
+)
+
 @dataclass
 class ProjectCashflow:
     """Store project cashflow results"""
@@ -21,6 +125,235 @@ class ProjectCashflow:
     annual_metrics: Dict[str, Any]
     summary_kpis: Dict[str, float]
 
+def _growth_factors(rate: Any, n: int, dtype: Any = np.float64) -> np.ndarray:
+    """(1 + rate) ** (year - 1) for years 1..n, as a running product along the last axis"""
+    rate = np.asarray(rate, dtype=dtype)
+    steps = np.empty(rate.shape + (n,), dtype=dtype)
+    steps[..., 0] = 1.0
+    steps[..., 1:] = (1.0 + rate)[..., None]
+    return np.cumprod(steps, axis=-1)
+
+@functools.lru_cache(maxsize=64)
+def _growth_vec(rate: float, n: int) -> np.ndarray:
+    """Cached, read-only growth factors for a scalar rate"""
+    v = _growth_factors(rate, n)
+    v.setflags(write=False)
+    return v
+
+@functools.lru_cache(maxsize=64)
+def _disc_vec(rate: float, n: int) -> np.ndarray:
+    """Cached, read-only discount factors 1 / (1 + rate) ** t for t = 0..n"""
+    v = 1.0 / np.power(1.0 + rate, np.arange(n + 1))
+    v.setflags(write=False)
+    return v
+
+def _apply_scenario_adjustments(params: Dict[str, float], scenario_adj: Dict[str, float]) -> Dict[str, float]:
+    """Apply scenario adjustments to base parameters"""
+    adj_params = params.copy()
+    adj_params['total_investment'] *= (1 + scenario_adj['capex_adj'])
+    adj_params['initial_revenue'] *= (1 + scenario_adj['revenue_adj'])
+    adj_params['op_cost_ratio'] *= (1 + scenario_adj['opex_adj'])
+    adj_params['debt_rate'] *= (1 + scenario_adj['debt_rate_adj'])
+    return adj_params
+
+def _build_cashflow(adj_params: Dict[str, float]) -> Tuple[Dict[str, np.ndarray], int]:
+    """Build the annual cashflow columns and the number of debt-service years"""
+    n = int(adj_params['project_period'])
+    years = np.arange(1, n + 1)
+    growth_factor = _growth_vec(float(adj_params['revenue_growth']), n)
+    inflation_factor = _growth_vec(float(adj_params['inflation']), n)
+    
+    # Revenue & Operating Cost
+    revenue, opcost, ebitda = _operating_kernel(
+        growth_factor, inflation_factor,
+        float(adj_params['initial_revenue']), float(adj_params['op_cost_ratio'])
+    )
+    
+    # Depreciation & Tax
+    annual_depreciation = adj_params['total_investment'] / adj_params['depreciation_period']
+    depreciation = np.zeros(n)
+    depreciation[:int(min(n, adj_params['depreciation_period']))] = annual_depreciation
+    ebit = ebitda - depreciation
+    
+    # Debt Schedule & Interest
+    debt_investment = adj_params['total_investment'] * (1 - adj_params['equity_ratio'])
+    annual_principal = debt_investment / adj_params['project_period']
+    
+    # Straight-line repayment over the whole project period: any debt is outstanding
+    # (and serviced) in every year, and an all-equity project has no debt years
+    debt_years = n if debt_investment > 0 else 0
+    debt_balance = np.maximum(0, debt_investment - annual_principal * (years - 1))
+    interest = debt_balance * adj_params['debt_rate']
+    principal = np.zeros(n)
+    principal[:debt_years] = annual_principal
+    debt_service = interest + principal
+    
+    # Tax Calculation with Loss Carryforward
+    ebt = ebit - interest
+    taxable_income, tax = _calculate_tax_with_loss_carryforward(ebt, adj_params['tax_rate'])
+    
+    # Cash Flow to Equity & Debt Service Coverage
+    cfads = ebitda - tax  # Cash Flow Available for Debt Service
+    dscr = np.full(n, np.inf)
+    dscr[:debt_years] = cfads[:debt_years] / debt_service[:debt_years]
+    
+    cols = {
+        'Revenue': revenue,
+        'OpCost': opcost,
+        'EBITDA': ebitda,
+        'Depreciation': depreciation,
+        'EBIT': ebit,
+        'Debt_Balance_Start': debt_balance,
+        'Interest_Payment': interest,
+        'Principal_Repayment': principal,
+        'Debt_Service': debt_service,
+        'EBT': ebt,
+        'Taxable_Income': taxable_income,
+        'Tax': tax,
+        'CFAds': cfads,
+        'DSCR': dscr,
+    }
+    return cols, debt_years
+
+def _calculate_tax_with_loss_carryforward(ebt: np.ndarray, tax_rate: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate tax with loss carryforward logic"""
+    return _tax_loop_numba(np.asarray(ebt, dtype=np.float64), float(tax_rate))
+
+def _calculate_kpis(cols: Dict[str, np.ndarray], adj_params: Dict[str, float], debt_years: int) -> Dict[str, float]:
+    """Calculate key performance indicators"""
+    # NPV Calculation
+    equity_investment = adj_params['total_investment'] * adj_params['equity_ratio']
+    debt_investment = adj_params['total_investment'] * (1 - adj_params['equity_ratio'])
+    
+    # Project cashflow for NPV (year 0 = investment outflow)
+    n = len(cols['CFAds'])
+    project_cf = np.empty(n + 1)
+    project_cf[0] = -adj_params['total_investment']
+    project_cf[1:] = cols['CFAds']
+    discount_factors = _disc_vec(float(adj_params['discount_rate']), n)
+    project_npv = float(np.dot(project_cf, discount_factors))
+    
+    # IRR Calculation
+    project_irr = _irr(project_cf)
+    
+    # DSCR Statistics
+    valid_dscr = cols['DSCR'][:debt_years]
+    min_dscr = valid_dscr.min() if debt_years > 0 else np.inf
+    avg_dscr = valid_dscr.mean() if debt_years > 0 else 0
+    
+    # Payback Period
+    # argmax finds the first recovered year; it returns 0 when none is, hence the check
+    cumsum_cf = np.cumsum(project_cf[1:])
+    first = (cumsum_cf >= 0).argmax()
+    payback_period = first + 1 if cumsum_cf[first] >= 0 else np.inf
+    
+    # Profitability Index
+    pv_inflows = float(np.dot(project_cf[1:], discount_factors[1:]))
+    profitability_index = pv_inflows / equity_investment if equity_investment > 0 else 0
+    
+    return {
+        'project_npv': project_npv,
+        'project_irr': project_irr if not np.isnan(project_irr) else None,
+        'min_dscr': float(min_dscr) if min_dscr != np.inf else None,
+        'avg_dscr': float(avg_dscr),
+        'payback_period': float(payback_period) if payback_period != np.inf else None,
+        'profitability_index': profitability_index,
+        'equity_npv': project_npv,
+        'debt_coverage': float(avg_dscr),
+    }
+
+def _build_cashflow_batch(adj_list: List[Dict[str, float]]) -> Dict[str, np.ndarray]:
+    """Build (S, T) cashflow matrices for S parameter sets sharing one project period"""
+    dtype = np.float32 if USE_FP32_SWEEP else np.float64
+    # Rows are parameter sets, so in C order each row's year series is contiguous
+    # (the column-major layout of a (T, S) table) for the per-row reductions
+    p = {key: np.array([a[key] for a in adj_list], dtype=dtype)[:, None] for key in _BATCH_PARAMS}
+    n = int(adj_list[0]['project_period'])
+    years = np.arange(1, n + 1, dtype=dtype)
+    growth_factor = _growth_factors(p['revenue_growth'][:, 0], n, dtype)
+    inflation_factor = _growth_factors(p['inflation'][:, 0], n, dtype)
+    
+    # Revenue & Operating Cost
+    revenue = p['initial_revenue'] * growth_factor
+    opcost = revenue * p['op_cost_ratio'] * inflation_factor
+    ebitda = revenue - opcost
+    
+    # Depreciation
+    annual_depreciation = p['total_investment'] / p['depreciation_period']
+    depreciation = np.where(years <= p['depreciation_period'], annual_depreciation, 0.0)
+    ebit = ebitda - depreciation
+    
+    # Debt Schedule & Interest
+    debt_investment = p['total_investment'] * (1 - p['equity_ratio'])
+    annual_principal = debt_investment / n
+    debt_balance = np.maximum(0, debt_investment - annual_principal * (years - 1))
+    interest = debt_balance * p['debt_rate']
+    principal = np.where(debt_balance > 0, annual_principal, 0.0)
+    debt_service = interest + principal
+    
+    # Tax Calculation with Loss Carryforward
+    ebt = ebit - interest
+    _, tax = _tax_gufunc(ebt, p['tax_rate'][:, 0])
+    
+    # Cash Flow Available for Debt Service & Coverage
+    cfads = ebitda - tax
+    debt_active = debt_service > 0
+    dscr = np.divide(cfads, debt_service, out=np.full_like(cfads, np.inf), where=debt_active)
+    
+    return {'CFAds': cfads, 'DSCR': dscr, 'Debt_Active': debt_active}
+
+def _calculate_kpis_batch(cols: Dict[str, np.ndarray], adj_list: List[Dict[str, float]]) -> List[Dict[str, float]]:
+    """Key performance indicators for every row of a batch, reduced over years in float64"""
+    cfads = cols['CFAds']
+    s, n = cfads.shape
+    total_investment = np.array([a['total_investment'] for a in adj_list])
+    equity_investment = total_investment * np.array([a['equity_ratio'] for a in adj_list])
+    discount_rate = np.array([a['discount_rate'] for a in adj_list])
+    
+    # NPV & Profitability Index (project_cf upcasts a float32 sweep)
+    project_cf = np.empty((s, n + 1))
+    project_cf[:, 0] = -total_investment
+    project_cf[:, 1:] = cfads
+    discount_factors = np.stack([_disc_vec(float(rate), n) for rate in discount_rate])
+    pv_inflows = np.einsum('ij,ij->i', project_cf[:, 1:], discount_factors[:, 1:])
+    project_npv = pv_inflows - total_investment
+    
+    # DSCR Statistics over debt-service years
+    debt_active = cols['Debt_Active']
+    n_active = debt_active.sum(axis=1)
+    min_dscr = np.where(debt_active, cols['DSCR'], np.inf).min(axis=1)
+    avg_dscr = np.where(debt_active, cols['DSCR'], 0.0).sum(axis=1, dtype=np.float64) / np.maximum(n_active, 1)
+    
+    # Payback Period
+    recovered = np.cumsum(project_cf[:, 1:], axis=1) >= 0
+    payback_period = np.where(recovered.any(axis=1), recovered.argmax(axis=1) + 1, np.inf)
+    
+    results = []
+    for k in range(s):
+        project_irr = _irr(project_cf[k])
+        results.append({
+            'project_npv': float(project_npv[k]),
+            'project_irr': project_irr if not np.isnan(project_irr) else None,
+            'min_dscr': float(min_dscr[k]) if min_dscr[k] != np.inf else None,
+            'avg_dscr': float(avg_dscr[k]),
+            'payback_period': float(payback_period[k]) if payback_period[k] != np.inf else None,
+            'profitability_index': float(pv_inflows[k] / equity_investment[k]) if equity_investment[k] > 0 else 0,
+            'equity_npv': float(project_npv[k]),
+            'debt_coverage': float(avg_dscr[k]),
+        })
+    return results
+
+def _compute_batch(adj_list: List[Dict[str, float]]) -> List[Dict[str, float]]:
+    """Summary KPIs for several scenario-adjusted parameter sets in one broadcasted pass"""
+    if not adj_list:
+        return []
+    return _calculate_kpis_batch(_build_cashflow_batch(adj_list), adj_list)
+
+def _compute(adj_params: Dict[str, float]) -> Dict[str, float]:
+    """Summary KPIs for one set of scenario-adjusted parameters"""
+    cols, debt_years = _build_cashflow(adj_params)
+    return _calculate_kpis(cols, adj_params, debt_years)
+
 class PPPFinancialEngine:
     """Core calculation engine for PPP financial modeling"""
     
@@ -33,41 +366,16 @@ class PPPFinancialEngine:
     def calculate_project_cashflow(self) -> ProjectCashflow:
         """Calculate full project cashflow over project period"""
         # Apply scenario adjustments
-        adj_params = self._apply_scenario_adjustments()
-        
-        # Initialize cashflow dataframe
-        years = np.arange(1, adj_params['project_period'] + 1)
-        df = pd.DataFrame(index=pd.Index(years, name='Year'))
-        
-        # Revenue & Operating Cost
-        df['Revenue'] = adj_params['initial_revenue'] * (1 + adj_params['revenue_growth']) ** (years - 1)
-        df['OpCost'] = df['Revenue'] * adj_params['op_cost_ratio'] * (1 + adj_params['inflation']) ** (years - 1)
-        df['EBITDA'] = df['Revenue'] - df['OpCost']
-        
-        # Depreciation & Tax
-        annual_depreciation = adj_params['total_investment'] / adj_params['depreciation_period']
-        df['Depreciation'] = np.where(years <= adj_params['depreciation_period'], annual_depreciation, 0)
-        df['EBIT'] = df['EBITDA'] - df['Depreciation']
-        
-        # Debt Schedule & Interest
-        debt_investment = adj_params['total_investment'] * (1 - adj_params['equity_ratio'])
-        annual_principal = debt_investment / adj_params['project_period']
-        
-        df['Debt_Balance_Start'] = np.maximum(0, debt_investment - annual_principal * (years - 1))
-        df['Interest_Payment'] = df['Debt_Balance_Start'] * adj_params['debt_rate']
-        df['Principal_Repayment'] = np.where(df['Debt_Balance_Start'] > 0, annual_principal, 0)
-        df['Debt_Service'] = df['Interest_Payment'] + df['Principal_Repayment']
-        
-        # Tax Calculation with Loss Carryforward
-        df['EBT'] = df['EBIT'] - df['Interest_Payment']
-        df['Taxable_Income'], df['Tax'] = self._calculate_tax_with_loss_carryforward(df, adj_params['tax_rate'])
-        
-        # Cash Flow to Equity & Debt Service Coverage
-        df['CFAds'] = df['EBITDA'] - df['Tax']  # Cash Flow Available for Debt Service
-        df['DSCR'] = np.where(df['Debt_Service'] > 0, df['CFAds'] / df['Debt_Service'], np.inf)
+        adj_params = _apply_scenario_adjustments(self.params, self.scenario_adj)
+        cols, debt_years = _build_cashflow(adj_params)
         
         # Calculate summary KPIs
-        kpis = self._calculate_kpis(df, adj_params)
+        kpis = _calculate_kpis(cols, adj_params, debt_years)
+        
+        # Materialize the cashflow table once, from the finished columns;
+        # copy=False keeps each 1-D array as its own block instead of stacking them
+        years = np.arange(1, len(cols['CFAds']) + 1)
+        df = pd.DataFrame(cols, index=pd.Index(years, name='Year'), copy=False)
         
         return ProjectCashflow(
             cashflow_df=df,
@@ -75,96 +383,29 @@ class PPPFinancialEngine:
             summary_kpis=kpis
         )
     
-    def _apply_scenario_adjustments(self) -> Dict[str, float]:
-        """Apply scenario adjustments to base parameters"""
-        adj_params = self.params.copy()
-        adj_params['total_investment'] *= (1 + self.scenario_adj['capex_adj'])
-        adj_params['initial_revenue'] *= (1 + self.scenario_adj['revenue_adj'])
-        adj_params['op_cost_ratio'] *= (1 + self.scenario_adj['opex_adj'])
-        adj_params['debt_rate'] *= (1 + self.scenario_adj['debt_rate_adj'])
-        return adj_params
-    
-    def _calculate_tax_with_loss_carryforward(self, df: pd.DataFrame, tax_rate: float) -> Tuple[np.ndarray, np.ndarray]:
-        """Calculate tax with loss carryforward logic"""
-        taxable_income = np.zeros(len(df))
-        tax = np.zeros(len(df))
-        cumulative_loss = 0
-        
-        for i, year in enumerate(df.index):
-            ebt = df.loc[year, 'EBT']
-            loss_to_use = min(cumulative_loss, max(0, -ebt))
-            taxable = max(0, ebt + loss_to_use)
-            taxable_income[i] = taxable
-            tax[i] = max(0, taxable * tax_rate)
-            
-            if ebt < 0:
-                cumulative_loss += abs(ebt)
-            else:
-                cumulative_loss -= loss_to_use
-        
-        return taxable_income, tax
-    
-    def _calculate_kpis(self, df: pd.DataFrame, adj_params: Dict[str, float]) -> Dict[str, float]:
-        """Calculate key performance indicators"""
-        # NPV Calculation
-        equity_investment = adj_params['total_investment'] * adj_params['equity_ratio']
-        debt_investment = adj_params['total_investment'] * (1 - adj_params['equity_ratio'])
-        
-        # Project cashflow for NPV
-        project_cf = [-adj_params['total_investment']] + df['CFAds'].tolist()
-        project_npv = npf.npv(adj_params['discount_rate'], project_cf)
-        
-        # IRR Calculation
-        try:
-            project_irr = npf.irr(project_cf)
-        except:
-            project_irr = np.nan
-        
-        # DSCR Statistics
-        valid_dscr = df['DSCR'][df['DSCR'] != np.inf]
-        min_dscr = valid_dscr.min() if len(valid_dscr) > 0 else np.inf
-        avg_dscr = valid_dscr.mean() if len(valid_dscr) > 0 else 0
-        
-        # Payback Period
-        cumsum_cf = np.cumsum(project_cf[1:])
-        payback_idx = np.where(cumsum_cf >= 0)[0]
-        payback_period = payback_idx[0] + 1 if len(payback_idx) > 0 else np.inf
-        
-        # Profitability Index
-        pv_inflows = sum([df['CFAds'].iloc[i] / ((1 + adj_params['discount_rate']) ** (i+1)) for i in range(len(df))])
-        profitability_index = pv_inflows / equity_investment if equity_investment > 0 else 0
-        
-        return {
-            'project_npv': project_npv,
-            'project_irr': project_irr if not np.isnan(project_irr) else None,
-            'min_dscr': float(min_dscr) if min_dscr != np.inf else None,
-            'avg_dscr': float(avg_dscr),
-            'payback_period': float(payback_period) if payback_period != np.inf else None,
-            'profitability_index': profitability_index,
-            'equity_npv': project_npv,
-            'debt_coverage': float(avg_dscr),
-        }
-    
     def sensitivity_analysis(self, variable: str, values: List[float]) -> pd.DataFrame:
         """Perform sensitivity analysis on a single variable"""
-        results = []
+        adj_list = []
         for value in values:
             test_params = self.params.copy()
             test_params[variable] = value
-            engine = PPPFinancialEngine(test_params, self.scenario)
-            result = engine.calculate_project_cashflow()
-            kpis = result.summary_kpis.copy()
+            adj_list.append(_apply_scenario_adjustments(test_params, self.scenario_adj))
+        
+        # A project_period sweep changes the number of years, so it cannot broadcast
+        if variable == 'project_period':
+            results = [_compute(adj_params) for adj_params in adj_list]
+        else:
+            results = _compute_batch(adj_list)
+        
+        for kpis, value in zip(results, values):
             kpis[variable] = value
-            results.append(kpis)
         
         return pd.DataFrame(results)
     
     def scenario_analysis(self, scenarios: List[str]) -> Dict[str, Dict[str, float]]:
         """Compare multiple scenarios"""
-        scenario_results = {}
-        for scenario in scenarios:
-            engine = PPPFinancialEngine(self.params, scenario)
-            result = engine.calculate_project_cashflow()
-            scenario_results[scenario] = result.summary_kpis
-        
-        return scenario_results
+        adj_list = [
+            _apply_scenario_adjustments(self.params, SCENARIO_ADJUSTMENTS.get(scenario, SCENARIO_ADJUSTMENTS['Base Case']))
+            for scenario in scenarios
+        ]
+        return dict(zip(scenarios, _compute_batch(adj_list)))
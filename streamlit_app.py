@@ -4,13 +4,12 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from financial_engine import PPPFinancialEngine
+from financial_engine import PPPFinancialEngine, ProjectCashflow
 from config import (
     APP_TITLE, APP_DESCRIPTION, APP_VERSION, PARAMETER_RANGES, 
     SCENARIO_ADJUSTMENTS, FINANCIAL_BENCHMARKS, UI_CONFIG
 )
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 
 # ===== PAGE CONFIG =====
@@ -38,6 +37,24 @@ if 'calculation_done' not in st.session_state:
 if 'last_results' not in st.session_state:
     st.session_state.last_results = None
 
+# ===== CACHED CALCULATIONS =====
+# Streamlit reruns the script on every widget change; parameters are passed
+# as sorted (key, value) tuples so unchanged inputs hit the cache
+@st.cache_data
+def _compute_result(params_tuple: tuple, scenario: str) -> ProjectCashflow:
+    """Full project cashflow for one parameter set & scenario"""
+    return PPPFinancialEngine(dict(params_tuple), scenario).calculate_project_cashflow()
+
+@st.cache_data
+def _compute_sensitivity(params_tuple: tuple, scenario: str, variable: str, values_tuple: tuple) -> pd.DataFrame:
+    """Sensitivity of KPIs to a single variable"""
+    return PPPFinancialEngine(dict(params_tuple), scenario).sensitivity_analysis(variable, list(values_tuple))
+
+@st.cache_data
+def _compute_scenarios(params_tuple: tuple, scenarios_tuple: tuple) -> dict:
+    """KPIs for each scenario"""
+    return PPPFinancialEngine(dict(params_tuple)).scenario_analysis(list(scenarios_tuple))
+
 # ===== HEADER & TITLE =====
 col1, col2 = st.columns([3, 1])
 with col1:
@@ -176,8 +193,8 @@ if st.session_state.calculation_done:
     }
     
     # Calculate
-    engine = PPPFinancialEngine(inputs, scenario)
-    result = engine.calculate_project_cashflow()
+    params_tuple = tuple(sorted(inputs.items()))
+    result = _compute_result(params_tuple, scenario)
     kpis = result.summary_kpis
     
     st.session_state.last_results = result
@@ -317,14 +334,16 @@ if st.session_state.calculation_done:
         )
         if st.button("Run Sensitivity"):
             test_values = np.linspace(test_range[0], test_range[1], 5)
-            sens_results = engine.sensitivity_analysis(sensitivity_var, test_values)
+            sens_results = _compute_sensitivity(
+                params_tuple, scenario, sensitivity_var, tuple(float(v) for v in test_values)
+            )
             st.dataframe(sens_results, use_container_width=True)
     
     # ===== SCENARIO COMPARISON =====
     if show_comparison:
         st.subheader("⚖️ Scenario Comparison")
         scenarios = list(SCENARIO_ADJUSTMENTS.keys())
-        comparison = engine.scenario_analysis(scenarios)
+        comparison = _compute_scenarios(params_tuple, tuple(scenarios))
         comparison_df = pd.DataFrame(comparison).T
         st.dataframe(comparison_df.style.format('{:.2f}'), use_container_width=True)
 else:
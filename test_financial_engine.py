@@ -0,0 +1,39 @@
+# test_financial_engine.py - Regression checks for the calculation engine
+
+import numpy as np
+import pytest
+
+from financial_engine import _irr
+
+npf = pytest.importorskip("numpy_financial")
+
+
+def _random_cashflows(rng, n_cases, min_cf):
+    """-CAPEX followed by decaying CFADS; min_cf < 0 allows several sign changes"""
+    for _ in range(n_cases):
+        n = rng.integers(5, 45)
+        cf = np.empty(n + 1)
+        cf[0] = -rng.uniform(100, 20000)
+        cf[1:] = rng.uniform(min_cf, 3000, n) * rng.uniform(0.01, 2) * rng.uniform(0.8, 1.0) ** np.arange(n)
+        yield cf
+
+
+def _assert_irr_matches(cf):
+    expected = npf.irr(cf)
+    actual = _irr(cf)
+    if np.isnan(expected):
+        assert np.isnan(actual)
+    else:
+        assert actual == pytest.approx(expected, abs=1e-6)
+
+
+def test_irr_low_negative_rate_converges():
+    # Newton's first step overshoots far past the root here
+    _assert_irr_matches(np.array([-10202.0] + [44.7 * 0.93 ** t for t in range(40)]))
+
+
+@pytest.mark.parametrize("min_cf", [0.0, -200.0], ids=["conventional", "sign-changes"])
+def test_irr_matches_numpy_financial(min_cf):
+    rng = np.random.default_rng(0)
+    for cf in _random_cashflows(rng, 2000, min_cf):
+        _assert_irr_matches(cf)